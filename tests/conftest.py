@@ -0,0 +1,54 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+from operator import ne
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from app import app, activities
+from tests.helpers import ACTIVITIES_URL, jload
+
+
+# Snapshot of the initial participants, taken once at import time.
+# Tuples are immutable, so the snapshot can be shared across every test.
+_ORIGINAL = {k: tuple(v["participants"]) for k, v in activities.items()}
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a single test client for the FastAPI app per worker"""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def activities_snapshot(client):
+    """Fetch GET /activities once and share the decoded body across a module"""
+    return jload(client.get(ACTIVITIES_URL))
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """Create an async client that calls the ASGI app directly"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="class")
+def reset_activities():
+    """Reset modified activities to initial state after each test class
+
+    Tests in a class share state, so they must not reuse an activity and email.
+    """
+    yield
+    # Restore original activities that were modified, comparing each list
+    # against the snapshot element by element so unchanged ones aren't copied
+    for activity_name, original in _ORIGINAL.items():
+        participants = activities[activity_name]["participants"]
+        if len(participants) != len(original) or any(map(ne, participants, original)):
+            activities[activity_name]["participants"] = list(original)
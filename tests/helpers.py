@@ -0,0 +1,20 @@
+"""
+Helpers shared by the Mergington High School Activities API tests
+"""
+
+import orjson
+
+
+ACTIVITIES_URL = "/activities"
+CHESS_SIGNUP = "/activities/Chess Club/signup"
+CHESS_UNREG = "/activities/Chess Club/unregister"
+PROGRAMMING_SIGNUP = "/activities/Programming Class/signup"
+ART_SIGNUP = "/activities/Art Club/signup"
+ART_UNREG = "/activities/Art Club/unregister"
+FAKE_SIGNUP = "/activities/Fake Activity/signup"
+FAKE_UNREG = "/activities/Fake Activity/unregister"
+
+
+def jload(response):
+    """Decode a JSON response body with orjson instead of the stdlib json"""
+    return orjson.loads(response.content)
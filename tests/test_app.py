@@ -2,35 +2,22 @@
 Tests for the Mergington High School Activities API
 """
 
-import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from app import app, activities
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+import asyncio
 
+import pytest
 
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original activities
-    original_activities = {
-        k: {"participants": list(v["participants"])} 
-        for k, v in activities.items()
-    }
-    yield
-    # Restore original activities
-    for activity_name, data in original_activities.items():
-        activities[activity_name]["participants"] = data["participants"]
+from app import activities
+from tests.helpers import (
+    ACTIVITIES_URL,
+    ART_SIGNUP,
+    ART_UNREG,
+    CHESS_SIGNUP,
+    CHESS_UNREG,
+    FAKE_SIGNUP,
+    FAKE_UNREG,
+    PROGRAMMING_SIGNUP,
+    jload,
+)
 
 
 class TestGetActivities:
@@ -38,22 +25,20 @@ class TestGetActivities:
     
     def test_get_activities_returns_all_activities(self, client):
         """Test that GET /activities returns all activities"""
-        response = client.get("/activities")
+        response = client.get(ACTIVITIES_URL)
         assert response.status_code == 200
-        data = response.json()
+        data = jload(response)
         assert isinstance(data, dict)
         assert len(data) > 0
         assert "Chess Club" in data
     
-    def test_get_activities_has_required_fields(self, client):
+    @pytest.mark.parametrize(
+        "field", ["description", "schedule", "max_participants", "participants"]
+    )
+    def test_get_activities_has_required_fields(self, activities_snapshot, field):
         """Test that activities have required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        for activity_name, activity_data in data.items():
-            assert "description" in activity_data
-            assert "schedule" in activity_data
-            assert "max_participants" in activity_data
-            assert "participants" in activity_data
+        for activity_name, activity_data in activities_snapshot.items():
+            assert field in activity_data
 
 
 class TestSignup:
@@ -62,11 +47,11 @@ class TestSignup:
     def test_signup_for_activity_success(self, client, reset_activities):
         """Test successful signup for an activity"""
         response = client.post(
-            "/activities/Chess Club/signup",
+            CHESS_SIGNUP,
             params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 200
-        data = response.json()
+        data = jload(response)
         assert "message" in data
         assert "student@mergington.edu" in data["message"]
         
@@ -76,46 +61,41 @@ class TestSignup:
     def test_signup_for_nonexistent_activity(self, client):
         """Test signup for a non-existent activity"""
         response = client.post(
-            "/activities/Fake Activity/signup",
+            FAKE_SIGNUP,
             params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
-        data = response.json()
+        data = jload(response)
         assert "not found" in data["detail"].lower()
     
-    def test_signup_duplicate_student(self, client, reset_activities):
+    def test_signup_duplicate_student(self, client):
         """Test that duplicate signups are prevented"""
         email = "michael@mergington.edu"
         response = client.post(
-            "/activities/Chess Club/signup",
+            CHESS_SIGNUP,
             params={"email": email}
         )
         assert response.status_code == 400
-        data = response.json()
+        data = jload(response)
         assert "already signed up" in data["detail"].lower()
     
-    def test_signup_multiple_activities(self, client, reset_activities):
+    @pytest.mark.asyncio
+    async def test_signup_multiple_activities(self, async_client, reset_activities):
         """Test that a student can sign up for multiple activities"""
         email = "testuser@mergington.edu"
+        params = {"email": email}
         
-        # Sign up for Chess Club
-        response1 = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
+        # Sign up for Chess Club and Programming Class
+        response1, response2 = await asyncio.gather(
+            async_client.post(CHESS_SIGNUP, params=params),
+            async_client.post(PROGRAMMING_SIGNUP, params=params),
         )
         assert response1.status_code == 200
-        
-        # Sign up for Programming Class
-        response2 = client.post(
-            "/activities/Programming Class/signup",
-            params={"email": email}
-        )
         assert response2.status_code == 200
         
         # Verify both signups worked
-        activities_data = client.get("/activities").json()
-        assert email in activities_data["Chess Club"]["participants"]
-        assert email in activities_data["Programming Class"]["participants"]
+        assert email in activities["Chess Club"]["participants"]
+        assert email in activities["Programming Class"]["participants"]
 
 
 class TestUnregister:
@@ -129,11 +109,11 @@ class TestUnregister:
         assert email in activities["Chess Club"]["participants"]
         
         response = client.delete(
-            "/activities/Chess Club/unregister",
+            CHESS_UNREG,
             params={"email": email}
         )
         assert response.status_code == 200
-        data = response.json()
+        data = jload(response)
         assert "message" in data
         
         # Verify participant was removed
@@ -142,39 +122,40 @@ class TestUnregister:
     def test_unregister_from_nonexistent_activity(self, client):
         """Test unregistration from a non-existent activity"""
         response = client.delete(
-            "/activities/Fake Activity/unregister",
+            FAKE_UNREG,
             params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
-        data = response.json()
+        data = jload(response)
         assert "not found" in data["detail"].lower()
     
     def test_unregister_not_signed_up(self, client):
         """Test unregistration for a student not signed up"""
         response = client.delete(
-            "/activities/Chess Club/unregister",
+            CHESS_UNREG,
             params={"email": "nonexistent@mergington.edu"}
         )
         assert response.status_code == 400
-        data = response.json()
+        data = jload(response)
         assert "not signed up" in data["detail"].lower()
     
     def test_signup_then_unregister(self, client, reset_activities):
         """Test signup followed by unregister"""
         email = "testuser@mergington.edu"
+        params = {"email": email}
         
         # Sign up
         response1 = client.post(
-            "/activities/Art Club/signup",
-            params={"email": email}
+            ART_SIGNUP,
+            params=params
         )
         assert response1.status_code == 200
         assert email in activities["Art Club"]["participants"]
         
         # Unregister
         response2 = client.delete(
-            "/activities/Art Club/unregister",
-            params={"email": email}
+            ART_UNREG,
+            params=params
         )
         assert response2.status_code == 200
         assert email not in activities["Art Club"]["participants"]
@@ -193,30 +174,26 @@ class TestRoot:
 class TestEdgeCases:
     """Test edge cases and data integrity"""
     
-    def test_activities_have_max_participants(self, client):
+    def test_activities_have_max_participants(self, activities_snapshot):
         """Test that all activities have max_participants field"""
-        response = client.get("/activities")
-        data = response.json()
-        for activity_name, activity_data in data.items():
+        for activity_name, activity_data in activities_snapshot.items():
             assert activity_data["max_participants"] > 0
     
-    def test_participant_count_does_not_exceed_max(self, client, reset_activities):
+    def test_participant_count_does_not_exceed_max(self, activities_snapshot):
         """Test that we can't add more participants than max_participants"""
         # This would need additional logic in the app to fully test
-        response = client.get("/activities")
-        data = response.json()
-        for activity_name, activity_data in data.items():
+        for activity_name, activity_data in activities_snapshot.items():
             assert len(activity_data["participants"]) <= activity_data["max_participants"]
     
     def test_email_format_preserved(self, client, reset_activities):
         """Test that email format is preserved in participant lists"""
         email = "valid.email+test@example.edu"
         response = client.post(
-            "/activities/Chess Club/signup",
+            CHESS_SIGNUP,
             params={"email": email}
         )
         assert response.status_code == 200
         
-        # Verify email format is preserved
-        activities_data = client.get("/activities").json()
+        # Verify email format is preserved end to end through GET /activities
+        activities_data = jload(client.get(ACTIVITIES_URL))
         assert email in activities_data["Chess Club"]["participants"]